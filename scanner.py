@@ -1,115 +1,620 @@
+import asyncio
+import io
 import math
+import os
 import boto3
+import numpy as np
 import argparse
 import sys
 import logging
+import queue
+import threading
 import json
-import csv
 from datetime import datetime
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+# Numba is an optional accelerator: when present, the per-line entropy
+# kernel runs as a JIT-compiled loop instead of NumPy calls.
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# aiobotocore is an optional engine: when present, --async-io drives the
+# scan from an event loop instead of the thread pool.
+try:
+    from aiobotocore.session import get_session as _get_aio_session
+    HAS_AIOBOTOCORE = True
+except ImportError:
+    HAS_AIOBOTOCORE = False
+
+# orjson serializes several times faster than stdlib json when installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Setup Logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# log2 of every possible distinct-byte count (0..256), indexed by the bound
+# prune in _entropy_u8_np: a line's entropy cannot exceed log2(alphabet size)
+LOG2 = [0.0] + [math.log2(i) for i in range(1, 257)]
+
 def calculate_shannon_entropy(data: str) -> float:
-    """Calculates the Shannon Entropy of a string."""
+    """Calculates the Shannon Entropy of a string.
+
+    The string is encoded once and measured at the byte level by the same
+    single-pass histogram kernel the scan path uses, instead of iterating
+    Unicode code points through a Python dict.
+    """
     if not data:
         return 0.0
-    
-    entropy = 0.0
-    length = len(data)
-    # Character frequency map
-    counts = {char: data.count(char) for char in set(data)}
-    
-    for char in counts:
-        p_x = counts[char] / length
-        entropy -= p_x * math.log2(p_x)
-        
-    return entropy
+
+    raw = data.encode('utf-8', 'ignore')
+    return float(_entropy_u8(np.frombuffer(raw, dtype=np.uint8), -1.0))
+
+# Lines shorter than this after stripping are too short to hold a secret
+MIN_LINE_LEN = 10
+
+# The byte values bytes.strip() treats as whitespace, as a 256-entry mask
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[[0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x20]] = True
+
+# Byte-class tables for the dominant line shapes in real dumps: a line drawn
+# entirely from one of these alphabets has entropy bounded by log2 of its
+# alphabet size: 4 bits for hex, log2(65) for base64 with its '=' padding
+_IS_HEX = np.zeros(256, dtype=np.uint8)
+_IS_HEX[list(b'0123456789abcdef')] = 1
+_HEX_BOUND = 4.0
+_IS_B64 = np.zeros(256, dtype=np.uint8)
+_IS_B64[list(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=')] = 1
+_B64_BOUND = math.log2(65)
+
+def _entropy_u8(data, threshold):
+    """Entropy of a uint8 array, or -1.0 if its upper bound <= threshold.
+
+    Builds a 256-entry histogram in one pass, then applies
+    H = log2(n) - sum(c * log2(c)) / n. Compiled by Numba when available;
+    the NumPy fallback below has identical semantics.
+    """
+    counts = np.zeros(256, np.int64)
+    for b in data:
+        counts[b] += 1
+
+    distinct = 0
+    for c in counts:
+        if c:
+            distinct += 1
+    if math.log2(distinct) <= threshold:
+        return -1.0
+
+    total = 0.0
+    for c in counts:
+        if c:
+            total += c * math.log2(c)
+    return math.log2(data.size) - total / data.size
+
+def _entropy_u8_np(data, threshold):
+    counts = np.bincount(data, minlength=1)
+    nz = counts[counts > 0]
+    if LOG2[nz.size] <= threshold:
+        return -1.0
+
+    p = nz / data.size
+    return float(-(p * np.log2(p)).sum())
+
+if HAS_NUMBA:
+    _entropy_u8 = njit(cache=True)(_entropy_u8)
+else:
+    _entropy_u8 = _entropy_u8_np
+
+def iter_line_entropies(body: bytes, threshold: float = None, cache: dict = None):
+    """Yields (line_no, line, entropy) for each line of a raw byte buffer.
+
+    Line boundaries come from a single vectorized pass over the buffer, and
+    each line's histogram is a C-level np.bincount, so the per-line Python
+    work is reduced to slicing. Lines stripping to fewer than MIN_LINE_LEN
+    bytes are skipped.
+
+    If a threshold is given, lines that cannot reach it are dropped without
+    computing their entropy: H is bounded above by log2 of the number of
+    distinct symbols, and most log lines use a tiny alphabet.
+
+    cache, when provided, memoizes entropy by line content: entropy is
+    deterministic in the bytes, and log files repeat boilerplate lines
+    heavily. Callers scope the dict to one object so it dies with the scan.
+    """
+    if not body:
+        return
+
+    buf = np.frombuffer(body, dtype=np.uint8)
+    starts = np.concatenate(([0], np.flatnonzero(buf == 0x0A) + 1))
+    if starts[-1] == buf.size:
+        # Trailing newline: no final unterminated line
+        starts = starts[:-1]
+
+    # Fused strip + length filter: each line's trimmed extent is the
+    # min/max index of its non-whitespace bytes, computed for all lines at
+    # once with reduceat (segments include their newline, so none is empty).
+    ws = _WHITESPACE[buf]
+    idx = np.arange(buf.size, dtype=np.int64)
+    lo = np.minimum.reduceat(np.where(ws, buf.size, idx), starts)
+    hi = np.maximum.reduceat(np.where(ws, -1, idx), starts)
+    keep = np.flatnonzero(hi - lo + 1 >= MIN_LINE_LEN)
+
+    # log2(distinct) of any non-empty line is >= 0, so -1.0 disables pruning
+    cutoff = -1.0 if threshold is None else threshold
+
+    # Alphabet specialization: classify every kept line in one reduceat pass
+    # (even result slots are the [lo, hi] spans) and drop lines whose
+    # alphabet bound cannot beat the threshold, before any histogram.
+    if keep.size and cutoff >= _HEX_BOUND:
+        spans = np.empty(2 * keep.size, dtype=np.int64)
+        spans[0::2] = lo[keep]
+        spans[1::2] = hi[keep] + 1
+        in_hex = np.append(_IS_HEX[buf], np.uint8(0))
+        survives = np.bitwise_and.reduceat(in_hex, spans)[0::2] == 0
+        if cutoff >= _B64_BOUND:
+            in_b64 = np.append(_IS_B64[buf], np.uint8(0))
+            survives &= np.bitwise_and.reduceat(in_b64, spans)[0::2] == 0
+        keep = keep[survives]
+
+    keep_list = keep.tolist()
+    lines = {i: body[lo[i]:hi[i] + 1] for i in keep_list}
+
+    if HAS_NUMBA:
+        # Compiled kernel: per-line calls are cheap, and the bound prune
+        # inside the kernel still skips the log-sum early
+        for i in keep_list:
+            line = lines[i]
+            if cache is None:
+                entropy = _entropy_u8(buf[lo[i]:hi[i] + 1], cutoff)
+            else:
+                entropy = cache.get(line)
+                if entropy is None:
+                    entropy = _entropy_u8(buf[lo[i]:hi[i] + 1], cutoff)
+                    cache[line] = entropy
+            if entropy >= 0.0:
+                yield i + 1, line, entropy
+        return
+
+    # NumPy path: many small per-line bincount/log2 calls would each pay
+    # ufunc dispatch, so distinct uncached lines are histogrammed into one
+    # (nlines, 256) matrix and reduced with a single np.log2 call.
+    entropies = {}
+    row_of = {}
+    pending = []
+    for i in keep_list:
+        line = lines[i]
+        if cache is not None:
+            cached = cache.get(line)
+            if cached is not None:
+                entropies[i] = cached
+                continue
+        if line not in row_of:
+            row_of[line] = len(pending)
+            pending.append(i)
+
+    if pending:
+        lengths = np.array([hi[i] - lo[i] + 1 for i in pending], dtype=np.int64)
+        flat = np.concatenate([buf[lo[i]:hi[i] + 1] for i in pending])
+        rows = np.repeat(np.arange(len(pending)), lengths)
+        counts = np.zeros((len(pending), 256), dtype=np.int64)
+        np.add.at(counts, (rows, flat), 1)
+
+        logc = np.log2(counts, where=counts > 0,
+                       out=np.zeros(counts.shape, dtype=np.float64))
+        n = lengths.astype(np.float64)
+        ent = np.log2(n) - (counts * logc).sum(axis=1) / n
+        # Same sentinel semantics as the scalar kernel: below-bound -> -1.0
+        bound = np.log2((counts > 0).sum(axis=1))
+        ent[bound <= cutoff] = -1.0
+
+        for line, row in row_of.items():
+            if cache is not None:
+                cache[line] = float(ent[row])
+
+    for i in keep_list:
+        entropy = entropies.get(i)
+        if entropy is None:
+            entropy = float(ent[row_of[lines[i]]])
+        if entropy >= 0.0:
+            yield i + 1, lines[i], entropy
+
+# Chunk size for streaming scans: large enough to amortize the kernel's
+# vectorized setup, small enough to stay cache-resident
+STREAM_CHUNK = 64 * 1024
+
+def iter_stream_entropies(stream, threshold: float = None):
+    """Like iter_line_entropies, but over a streaming body.
+
+    Reads the stream in STREAM_CHUNK pieces and feeds only complete lines
+    through the batched kernel, carrying the trailing partial line into the
+    next chunk. Peak memory is one chunk instead of the whole scan budget,
+    and scanning overlaps with the download.
+    """
+    carry = b''
+    base = 0
+    cache = {}
+    for chunk in iter(lambda: stream.read(STREAM_CHUNK), b''):
+        data = carry + chunk
+        cut = data.rfind(b'\n')
+        if cut < 0:
+            carry = data
+            continue
+
+        block, carry = data[:cut + 1], data[cut + 1:]
+        for line_no, line, entropy in iter_line_entropies(block, threshold, cache):
+            yield base + line_no, line, entropy
+        base += block.count(b'\n')
+
+    if carry:
+        for line_no, line, entropy in iter_line_entropies(carry, threshold, cache):
+            yield base + line_no, line, entropy
+
+# Cap on bytes scanned per object, however they are fetched
+MAX_SCAN_BYTES = 1024 * 1024
+
+# Error codes S3 returns when a prefix is being hammered too hard
+THROTTLE_CODES = frozenset({'SlowDown', 'Throttling', 'ThrottlingException',
+                            'RequestLimitExceeded', '503'})
+
+class _AdaptiveGate:
+    """TCP-style AIMD controller for in-flight S3 requests.
+
+    Workers take a permit around each object scan. Every INCREASE_AFTER
+    clean scans adds one permit (additive increase, up to the ceiling);
+    any throttle response halves the target (multiplicative decrease), with
+    the shrink applied as a debt settled by subsequent releases. This keeps
+    the scan near whatever rate the bucket's prefixes actually sustain
+    instead of trusting a hand-picked thread count.
+    """
+
+    INCREASE_AFTER = 20
+
+    def __init__(self, start: int, ceiling: int):
+        self.ceiling = ceiling
+        self._target = max(1, min(start, ceiling))
+        self._sem = threading.Semaphore(self._target)
+        self._lock = threading.Lock()
+        self._successes = 0
+        self._debt = 0
+
+    def acquire(self):
+        self._sem.acquire()
+
+    def throttled(self):
+        """Halves the concurrency target in response to a throttle error."""
+        with self._lock:
+            new_target = max(1, self._target // 2)
+            self._debt += self._target - new_target
+            self._target = new_target
+            self._successes = 0
+            logger.debug(f"[~] Throttled; concurrency reduced to {self._target}")
+
+    def release(self):
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.INCREASE_AFTER and self._target < self.ceiling:
+                self._successes = 0
+                self._target += 1
+                self._sem.release()
+            if self._debt:
+                self._debt -= 1
+            else:
+                self._sem.release()
 
 class S3Scanner:
-    def __init__(self, bucket_name: str, threshold: float, threads: int = 10, export_format: str = None):
+    # Common binary formats skipped to reduce noise
+    SKIP_EXT = frozenset({'.png', '.jpg', '.pdf', '.exe', '.zip', '.gz', '.tar'})
+
+    def __init__(self, bucket_name: str, threshold: float, threads: int = 10, export_format: str = None,
+                 use_select: bool = False, use_async: bool = False):
         self.bucket_name = bucket_name
         self.threshold = threshold
         self.threads = threads
         self.export_format = export_format
-        self.s3 = boto3.client('s3')
+        self.use_select = use_select
+        self.use_async = use_async
+        # botocore defaults to 10 pooled connections; size the pool to the
+        # worker count so threads beyond 10 don't discard and re-open sockets
+        self._client_config = Config(
+            max_pool_connections=max(self.threads, 10),
+            retries={'max_attempts': 3, 'mode': 'adaptive'}
+        )
+        # One shared Session, one lazily-built client per worker thread:
+        # avoids cross-thread contention on a single client's state
+        self._session = boto3.session.Session()
+        self._local = threading.local()
+        self.s3 = self._session.client('s3', config=self._client_config)
+        # --threads is the concurrency ceiling; the gate ramps up from half
+        # of it and backs off whenever S3 pushes back
+        self._gate = _AdaptiveGate(start=max(1, self.threads // 2), ceiling=self.threads)
+        # Shared transfer manager for whole-object downloads of small files:
+        # amortizes per-request setup and uses the AWS CRT client when the
+        # awscrt package is installed ('auto' falls back to classic otherwise)
+        self._transfer = create_transfer_manager(
+            self.s3, TransferConfig(preferred_transfer_client='auto'))
         self.results = []
 
-    def scan_object(self, key: str):
-        """Downloads and scans a single S3 object."""
+    def _client(self):
+        """Returns this thread's S3 client, creating it on first use."""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._session.client('s3', config=self._client_config)
+            self._local.client = client
+        return client
+
+    def _select_lines(self, key: str) -> bytes:
+        """Fetches scannable lines via S3 Select, filtering at the server.
+
+        Pushing the minimum-length predicate to S3 means short lines never
+        cross the wire. Each line arrives as one record, so line numbers in
+        findings refer to the filtered record stream, not the raw file.
+        """
+        response = self._client().select_object_content(
+            Bucket=self.bucket_name,
+            Key=key,
+            ExpressionType='SQL',
+            Expression=f"SELECT s._1 FROM s3object s WHERE CHAR_LENGTH(s._1) >= {MIN_LINE_LEN}",
+            InputSerialization={
+                # Whole lines as single-column records: NUL never appears in text
+                'CSV': {'FileHeaderInfo': 'NONE', 'RecordDelimiter': '\n', 'FieldDelimiter': '\x00'},
+                'CompressionType': 'NONE'
+            },
+            OutputSerialization={'CSV': {}}
+        )
+
+        chunks = []
+        total = 0
+        for event in response['Payload']:
+            if 'Records' in event:
+                chunk = event['Records']['Payload']
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_SCAN_BYTES:
+                    break
+        return b''.join(chunks)[:MAX_SCAN_BYTES]
+
+    def _scan_lines(self, key: str, line_iter):
+        """Runs the threshold filter over (line_no, line, entropy) triples.
+
+        Entropy is computed on raw bytes; lines are only decoded once they
+        are actually flagged (for the preview).
+        """
+        findings = []
+        for line_no, line, entropy in line_iter:
+            if entropy > self.threshold:
+                preview = line.decode('utf-8', errors='ignore')
+                finding = {
+                    "key": key,
+                    "line": line_no,
+                    "entropy": round(entropy, 2),
+                    "data_preview": preview[:15] + "...",
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+                findings.append(finding)
+                logger.warning(f"[!] POSITIVE | {key}:{line_no} | Entropy: {entropy:.2f}")
+        return findings
+
+    def scan_object(self, key: str, size: int = None):
+        """Downloads and scans a single S3 object.
+
+        size is the object length from the listing, when known; objects that
+        fit the scan budget go through the shared transfer manager instead of
+        a one-off ranged GET.
+        """
         findings = []
         try:
-            # Skip common binary formats to reduce noise
-            if any(key.lower().endswith(ext) for ext in ['.png', '.jpg', '.pdf', '.exe', '.zip', '.gz', '.tar']):
+            # O(1) suffix lookup instead of probing every known extension
+            if os.path.splitext(key)[1].lower() in self.SKIP_EXT:
                 return findings
 
-            response = self.s3.get_object(Bucket=self.bucket_name, Key=key)
-            # Read first 1MB to avoid memory blow-up on huge log files
-            body = response['Body'].read(1024 * 1024)
-            content = body.decode('utf-8', errors='ignore')
-            
-            for line_no, line in enumerate(content.splitlines(), 1):
-                clean_line = line.strip()
-                if not clean_line or len(clean_line) < 10:
-                    continue
-
-                entropy = calculate_shannon_entropy(clean_line)
-                if entropy > self.threshold:
-                    finding = {
-                        "key": key,
-                        "line": line_no,
-                        "entropy": round(entropy, 2),
-                        "data_preview": clean_line[:15] + "...",
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                    findings.append(finding)
-                    logger.warning(f"[!] POSITIVE | {key}:{line_no} | Entropy: {entropy:.2f}")
+            body = None
+            if self.use_select:
+                try:
+                    body = self._select_lines(key)
+                except Exception as e:
+                    # Not every object/region/endpoint supports Select (and
+                    # failures surface as more than ClientError); GET below
+                    logger.debug(f"[~] S3 Select unavailable for {key}, falling back: {str(e)}")
+
+            if body is None and size is not None and size <= MAX_SCAN_BYTES:
+                buf = io.BytesIO()
+                self._transfer.download(self.bucket_name, key, buf).result()
+                body = buf.getvalue()
+
+            if body is not None:
+                line_iter = iter_line_entropies(body, self.threshold, cache={})
+            else:
+                # Ask for the first 1MB only, so S3 never ships the rest of
+                # a huge object just for us to stop reading it
+                response = self._client().get_object(
+                    Bucket=self.bucket_name, Key=key,
+                    Range=f'bytes=0-{MAX_SCAN_BYTES - 1}'
+                )
+
+                # Extension check misses media uploaded without one; the GET
+                # response carries the content type for free. octet-stream is
+                # NOT skipped: it is the S3 default for untyped text uploads.
+                content_type = response.get('ContentType', '')
+                if content_type.startswith(('image/', 'video/', 'audio/')):
+                    return findings
 
+                # Stream the body chunk-wise instead of buffering the full
+                # 1MB and materializing every line up front
+                line_iter = iter_stream_entropies(response['Body'], self.threshold)
+
+            findings = self._scan_lines(key, line_iter)
+
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code', '') in THROTTLE_CODES:
+                self._gate.throttled()
+            logger.debug(f"[X] Error scanning {key}: {str(e)}")
         except Exception as e:
             logger.debug(f"[X] Error scanning {key}: {str(e)}")
-        
+
         return findings
 
+    @staticmethod
+    def _csv_field(value: str) -> str:
+        """Quotes a field only when CSV requires it (delimiter/quote/newline)."""
+        if '"' in value or ',' in value or '\n' in value:
+            return '"' + value.replace('"', '""') + '"'
+        return value
+
     def export_results(self):
         if not self.export_format or not self.results:
             return
 
         filename = f"findings_{self.bucket_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
+
         if self.export_format == 'json':
-            with open(f"{filename}.json", "w") as f:
-                json.dump(self.results, f, indent=4)
+            if HAS_ORJSON:
+                with open(f"{filename}.json", "wb") as f:
+                    f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(f"{filename}.json", "w") as f:
+                    json.dump(self.results, f, indent=4)
             logger.info(f"[*] Exported {len(self.results)} findings to {filename}.json")
-        
+
         elif self.export_format == 'csv':
-            keys = self.results[0].keys()
-            with open(f"{filename}.csv", "w", newline='') as f:
-                dict_writer = csv.DictWriter(f, fieldnames=keys)
-                dict_writer.writeheader()
-                dict_writer.writerows(self.results)
+            # The schema is fixed, so rows are joined directly instead of
+            # going through csv.DictWriter's per-row dispatch; only the two
+            # free-text fields ever need quoting
+            with open(f"{filename}.csv", "wb", buffering=1 << 20) as f:
+                f.write(b"key,line,entropy,data_preview,timestamp\n")
+                for r in self.results:
+                    row = (f"{self._csv_field(r['key'])},{r['line']},{r['entropy']},"
+                           f"{self._csv_field(r['data_preview'])},{r['timestamp']}\n")
+                    f.write(row.encode('utf-8'))
             logger.info(f"[*] Exported {len(self.results)} findings to {filename}.csv")
 
+    def _list_prefix(self, prefix, work):
+        """Pages one key prefix and queues each object for scanning.
+
+        Blocks when the work queue is full, so listing is backpressured by
+        scan throughput instead of racing ahead of it.
+        """
+        paginator = self._client().get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                work.put((obj['Key'], obj.get('Size')))
+
+    async def _run_async(self):
+        """Event-loop scan driver using aiobotocore.
+
+        A single async client multiplexes all GETs; a semaphore caps
+        in-flight requests at self.threads, and the CPU-bound entropy pass
+        runs in the default executor so the loop stays responsive.
+        """
+        sem = asyncio.Semaphore(self.threads)
+        loop = asyncio.get_running_loop()
+
+        async def scan(client, key):
+            async with sem:
+                try:
+                    response = await client.get_object(
+                        Bucket=self.bucket_name, Key=key,
+                        Range=f'bytes=0-{MAX_SCAN_BYTES - 1}'
+                    )
+                    content_type = response.get('ContentType', '')
+                    if content_type.startswith(('image/', 'video/', 'audio/')):
+                        return
+                    body = await response['Body'].read()
+                except Exception as e:
+                    logger.debug(f"[X] Error scanning {key}: {str(e)}")
+                    return
+
+            findings = await loop.run_in_executor(
+                None, self._scan_lines, key,
+                iter_line_entropies(body, self.threshold, cache={}))
+            self.results.extend(findings)
+
+        session = _get_aio_session()
+        async with session.create_client('s3', config=self._client_config) as client:
+            tasks = []
+            paginator = client.get_paginator('list_objects_v2')
+            async for page in paginator.paginate(Bucket=self.bucket_name):
+                for obj in page.get('Contents', []):
+                    if os.path.splitext(obj['Key'])[1].lower() in self.SKIP_EXT:
+                        continue
+                    tasks.append(asyncio.ensure_future(scan(client, obj['Key'])))
+            await asyncio.gather(*tasks)
+
     def run(self):
-        """Initiates parallel scan using boto3 paginator."""
-        paginator = self.s3.get_paginator('list_objects_v2')
-        
+        """Initiates parallel scan with prefix-sharded listing."""
         logger.info(f"[*] Starting scan on {self.bucket_name}")
         logger.info(f"[*] Entropy Threshold: {self.threshold}")
-        
-        with ThreadPoolExecutor(max_workers=self.threads) as executor:
-            futures = []
-            for page in paginator.paginate(Bucket=self.bucket_name):
-                if 'Contents' not in page:
-                    continue
-                
-                for obj in page['Contents']:
-                    futures.append(executor.submit(self.scan_object, obj['Key']))
-            
-            for future in as_completed(futures):
-                self.results.extend(future.result())
+
+        if self.use_async:
+            if HAS_AIOBOTOCORE:
+                asyncio.run(self._run_async())
+                self.export_results()
+                logger.info(f"[*] Scan complete. Total Findings: {len(self.results)}")
+                return
+            logger.warning("[~] aiobotocore not installed; falling back to thread pool")
+
+        # Bounded handoff between listing and scanning: producers block when
+        # scanners fall behind, keeping memory O(threads) instead of
+        # queueing a Future per key for the whole bucket.
+        work = queue.Queue(maxsize=2 * self.threads)
+
+        # Each worker accumulates findings locally and publishes its buffer
+        # once at exit, so the hot path never takes a shared lock
+        buffers = []
+
+        def worker():
+            local = []
+            while True:
+                item = work.get()
+                if item is None:
+                    break
+                # The gate, not the worker count, decides how many scans
+                # are actually in flight at once
+                self._gate.acquire()
+                try:
+                    local.extend(self.scan_object(*item))
+                finally:
+                    self._gate.release()
+            buffers.append(local)
+
+        workers = [threading.Thread(target=worker, name=f"scanner-{i}")
+                   for i in range(self.threads)]
+        for t in workers:
+            t.start()
+
+        # Shard listing by top-level prefix so pagination runs in parallel
+        # and overlaps with scanning. Root-level keys appear directly in
+        # the delimiter listing.
+        paginator = self.s3.get_paginator('list_objects_v2')
+        with ThreadPoolExecutor(max_workers=min(self.threads, 8),
+                                thread_name_prefix='lister') as listers:
+            lister_futures = []
+            for page in paginator.paginate(Bucket=self.bucket_name, Delimiter='/'):
+                for obj in page.get('Contents', []):
+                    work.put((obj['Key'], obj.get('Size')))
+                for cp in page.get('CommonPrefixes', []):
+                    lister_futures.append(
+                        listers.submit(self._list_prefix, cp['Prefix'], work))
+
+            for future in lister_futures:
+                future.result()
+
+        # One sentinel per worker shuts the pool down cleanly
+        for _ in workers:
+            work.put(None)
+        for t in workers:
+            t.join()
+        self.results.extend(chain.from_iterable(buffers))
 
         self.export_results()
         logger.info(f"[*] Scan complete. Total Findings: {len(self.results)}")
@@ -118,13 +623,19 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Architectural Entropy Scanner for S3")
     parser.add_argument("--bucket", required=True, help="Target S3 bucket name")
     parser.add_argument("--threshold", type=float, default=4.5, help="Entropy threshold (default 4.5)")
-    parser.add_argument("--threads", type=int, default=10, help="Parallel threads")
+    parser.add_argument("--threads", type=int, default=10,
+                        help="Concurrency ceiling; actual in-flight requests adapt to throttling")
     parser.add_argument("--export", choices=['json', 'csv'], help="Export format")
-    
+    parser.add_argument("--use-select", action="store_true",
+                        help="Filter lines server-side with S3 Select (falls back to GET)")
+    parser.add_argument("--async-io", action="store_true",
+                        help="Drive the scan with asyncio + aiobotocore (requires aiobotocore)")
+
     args = parser.parse_args()
-    
+
     try:
-        scanner = S3Scanner(args.bucket, args.threshold, args.threads, args.export)
+        scanner = S3Scanner(args.bucket, args.threshold, args.threads, args.export,
+                            use_select=args.use_select, use_async=args.async_io)
         scanner.run()
     except Exception as e:
         logger.error(f"[FATAL] Scanner failed: {str(e)}")
@@ -1,29 +1,108 @@
+import io
+import math
 import pytest
 import boto3
 from moto import mock_aws
-from scanner import S3Scanner, calculate_shannon_entropy
+import scanner
+from scanner import S3Scanner, calculate_shannon_entropy, iter_line_entropies, iter_stream_entropies
 
 def test_entropy_calculation():
     # Known high entropy (random string)
-    assert calculate_shannon_entropy("AQw923kf0239slk2309slk23") > 4.0
+    assert calculate_shannon_entropy("zXq9!Kw2@Vn7#Jf4$Tm8%Rd3") > 4.0
     # Known low entropy (repeating string)
     assert calculate_shannon_entropy("aaaaaaaaaaaaaaaaaaaaaaaa") < 1.0
 
+def test_line_entropy_kernel():
+    body = b"tiny\n   padded line with spaces   \nzXq9!Kw2@Vn7#Jf4$Tm8%Rd3\n"
+    results = list(iter_line_entropies(body))
+
+    # "tiny" strips below the minimum length and is skipped
+    assert [line_no for line_no, _, _ in results] == [2, 3]
+    # Kernel agrees with the scalar implementation on stripped lines
+    for _, line, entropy in results:
+        assert entropy == pytest.approx(calculate_shannon_entropy(line.decode()))
+
+    # Upper-bound prune: even the random line has only 24 distinct bytes,
+    # so with a threshold of 5.0 (> log2(24)) nothing can qualify
+    assert list(iter_line_entropies(body, threshold=5.0)) == []
+
+def test_hex_alphabet_prune():
+    body = b"deadbeefcafe0123456789abcdef0123\n"
+    # A pure-hex line is bounded at 4 bits, so a 4.0 threshold prunes it
+    # without computing entropy; without a threshold it still comes through
+    assert list(iter_line_entropies(body, threshold=4.0)) == []
+    assert len(list(iter_line_entropies(body))) == 1
+
+def test_base64_prune_bound_is_exact():
+    # All 65 base64 symbols (including '=' padding) twice: entropy is
+    # exactly log2(65) ~ 6.0224, which beats a 6.0 threshold, so the
+    # alphabet prune must not discard the line early
+    alphabet = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/='
+    body = alphabet * 2 + b'\n'
+    assert len(list(iter_line_entropies(body, threshold=6.0))) == 1
+    # At the bound itself the line can no longer qualify and is pruned
+    assert list(iter_line_entropies(body, threshold=math.log2(65))) == []
+
+def test_stream_kernel_matches_buffered(monkeypatch):
+    body = (b"tiny\nsome ordinary log line goes here\n" * 20
+            + b"zXq9!Kw2@Vn7#Jf4$Tm8%Rd3")
+    # Tiny chunks force lines to straddle chunk boundaries
+    monkeypatch.setattr(scanner, "STREAM_CHUNK", 7)
+
+    assert list(iter_stream_entropies(io.BytesIO(body))) == list(iter_line_entropies(body))
+
 @mock_aws
 def test_scanner_findings():
     bucket_name = "test-bucket"
     s3 = boto3.client("s3", region_name="us-east-1")
     s3.create_bucket(Bucket=bucket_name)
     
-    # Upload a "clean" file and a "sensitive" file
+    # Upload a "clean" file and "sensitive" files, one nested to exercise
+    # the prefix-sharded listing
     s3.put_object(Bucket=bucket_name, Key="clean.txt", Body="This is a normal text file.")
     s3.put_object(Bucket=bucket_name, Key="secret.txt", Body="export AWS_SECRET_ACCESS_KEY=AQw923kf0239slk2309slk23")
-    
+    s3.put_object(Bucket=bucket_name, Key="nested/deep/config.env", Body="TOKEN=zXq9!Kw2@Vn7#Jf4$Tm8%Rd3")
+
     scanner = S3Scanner(bucket_name, threshold=4.0)
     scanner.run()
-    
-    assert len(scanner.results) >= 1
-    assert scanner.results[0]['key'] == "secret.txt"
+
+    assert {r['key'] for r in scanner.results} == {"secret.txt", "nested/deep/config.env"}
+
+def test_adaptive_gate_aimd():
+    from scanner import _AdaptiveGate
+
+    gate = _AdaptiveGate(start=4, ceiling=8)
+    assert gate._target == 4
+
+    # A run of clean scans grows concurrency by one
+    for _ in range(gate.INCREASE_AFTER):
+        gate.acquire()
+        gate.release()
+    assert gate._target == 5
+
+    # A throttle response halves it
+    gate.throttled()
+    assert gate._target == 2
+
+def test_csv_export_quoting(tmp_path, monkeypatch):
+    import csv
+    monkeypatch.chdir(tmp_path)
+
+    sc = S3Scanner("export-bucket", threshold=4.0, export_format='csv')
+    sc.results = [{
+        "key": 'logs/we,ird"name.txt',
+        "line": 3,
+        "entropy": 4.72,
+        "data_preview": 'ab,"cd...',
+        "timestamp": "2026-08-31T00:00:00",
+    }]
+    sc.export_results()
+
+    csv_file = next(tmp_path.glob("findings_*.csv"))
+    with open(csv_file, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["key"] == 'logs/we,ird"name.txt'
+    assert rows[0]["data_preview"] == 'ab,"cd...'
 
 @mock_aws
 def test_binary_skipping():